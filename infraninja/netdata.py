@@ -1,6 +1,16 @@
+import os
+
 from pyinfra.api import deploy
 from pyinfra.operations import files, server
 
+# Resolved once at import, relative to this module rather than the caller's cwd
+TEMPLATE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "netdata",
+    "templates",
+    "netdata.conf.j2",
+)
+
 DEFAULTS = {
     "claim_token": "XXXXX",
     "claim_rooms": "XXXXX",
@@ -40,7 +50,7 @@ def deploy_netdata():
 
     netdata_config = files.template(
         name="Template the netdata.conf file",
-        src="../templates/netdata.conf.j2",
+        src=TEMPLATE_PATH,
         dest="/etc/netdata/netdata.conf",
         user="root",
         group="root",